@@ -201,6 +201,10 @@ class BatchAdapter:
         self.input_accessor = input_accessor
         self.target_accessor = target_accessor
         self.identifier_accessor = identifier_accessor
+        # Compile the accessors once so each step pays a single call instead of re-dispatching on the accessor type.
+        self._access_input = self._compile_accessor(input_accessor)
+        self._access_target = self._compile_accessor(target_accessor)
+        self._access_identifier = self._compile_accessor(identifier_accessor)
 
     def __call__(self, batch: Any) -> tuple[Any, Any, Any]:
         """
@@ -215,36 +219,48 @@ class BatchAdapter:
         Raises:
             ValueError: If accessors are invalid for the provided batch structure.
         """
-        input = self._access_value(batch, self.input_accessor)
-        target = self._access_value(batch, self.target_accessor)
-        identifier = self._access_value(batch, self.identifier_accessor)
-        return input, target, identifier
+        return self._access_input(batch), self._access_target(batch), self._access_identifier(batch)
 
-    def _access_value(self, data: Any, accessor: int | str | Callable) -> Any:
+    @staticmethod
+    def _compile_accessor(accessor: int | str | Callable | None) -> Callable:
         """
-        Accesses a value from the data using the provided accessor.
+        Compiles an accessor into a function that extracts the corresponding value from a batch.
 
         Args:
-            data: The data to access the value from.
-            accessor: The accessor to use. Can be an index (for lists/tuples),
-                      a key (for dictionaries), or a callable.
+            accessor: The accessor to compile. Can be an index (for lists/tuples),
+                      a key (for dictionaries), a callable, or None.
 
         Returns:
-            The accessed value.
+            A function that accesses the value from the batch.
 
         Raises:
-            ValueError: If the accessor type or data structure is invalid.
+            ValueError: If the accessor type is invalid.
         """
         if accessor is None:
-            return None
-        elif isinstance(accessor, int) and isinstance(data, (tuple, list)):
-            return data[accessor]
-        elif isinstance(accessor, str) and isinstance(data, dict):
-            return data[accessor]
-        elif callable(accessor):
-            return accessor(data)
-        else:
-            raise ValueError(f"Invalid accessor {accessor} of type {type(accessor)} for data type {type(data)}.")
+            return lambda data: None
+
+        if isinstance(accessor, int):
+
+            def access(data: Any) -> Any:
+                if isinstance(data, (tuple, list)):
+                    return data[accessor]
+                raise ValueError(f"Invalid accessor {accessor} of type {type(accessor)} for data type {type(data)}.")
+
+            return access
+
+        if isinstance(accessor, str):
+
+            def access(data: Any) -> Any:
+                if isinstance(data, dict):
+                    return data[accessor]
+                raise ValueError(f"Invalid accessor {accessor} of type {type(accessor)} for data type {type(data)}.")
+
+            return access
+
+        if callable(accessor):
+            return accessor
+
+        raise ValueError(f"Invalid accessor {accessor} of type {type(accessor)}.")
 
 
 class CriterionAdapter(_ArgumentsAndTransformsAdapter):
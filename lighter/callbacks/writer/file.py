@@ -103,7 +103,7 @@ def write_video(path, tensor):
     # Video tensor must be THWC. Permute CTHW -> THWC.
     tensor = tensor.permute(1, 2, 3, 0)
     # Video tensor must have 3 channels (RGB). Repeat the channel dim to convert grayscale to RGB.
-    if tensor.shape[-1] == 1:
+    if tensor.size(-1) == 1:
         tensor = tensor.repeat(1, 1, 1, 3)
     # Video tensor must be in the range [0, 1]. Scale to [0, 255].
     tensor = (tensor * 255).to(torch.uint8)
@@ -26,7 +26,10 @@ class TableWriter(BaseWriter):
 
     def __init__(self, path: str | Path, writer: str | Callable) -> None:
         super().__init__(path, writer)
-        self.csv_records = []
+        # Records are stored as two parallel columns rather than a dict per record: appends stay O(1)
+        # and the final DataFrame is built column-wise without materializing a dict per row.
+        self._identifiers: list = []
+        self._preds: list = []
 
     @property
     def writers(self) -> dict[str, Callable]:
@@ -34,6 +37,16 @@ class TableWriter(BaseWriter):
             "tensor": lambda tensor: tensor.item() if tensor.numel() == 1 else tensor.tolist(),
         }
 
+    @property
+    def csv_records(self) -> list[dict]:
+        """The records as a list of `{"identifier": ..., "pred": ...}` dicts, materialized from the columns."""
+        return [{"identifier": identifier, "pred": pred} for identifier, pred in zip(self._identifiers, self._preds)]
+
+    @csv_records.setter
+    def csv_records(self, records: list[dict]) -> None:
+        self._identifiers = [record["identifier"] for record in records]
+        self._preds = [record["pred"] for record in records]
+
     def write(self, tensor: Any, identifier: int | str) -> None:
         """
         Writes the tensor as a table record using the specified writer.
@@ -42,7 +55,8 @@ class TableWriter(BaseWriter):
             tensor: The tensor to record. Should not have a batch dimension.
             identifier: Identifier for the record.
         """
-        self.csv_records.append({"identifier": identifier, "pred": self.writer(tensor)})
+        self._identifiers.append(identifier)
+        self._preds.append(self.writer(tensor))
 
     def on_predict_epoch_end(self, trainer: Trainer, pl_module: System) -> None:
         """
@@ -61,7 +75,7 @@ class TableWriter(BaseWriter):
 
         # Save the records to a CSV file
         if trainer.is_global_zero:
-            df = pd.DataFrame(self.csv_records)
+            df = pd.DataFrame({"identifier": self._identifiers, "pred": self._preds})
             try:
                 df = df.sort_values("identifier")
             except TypeError:
@@ -70,4 +84,5 @@ class TableWriter(BaseWriter):
             df.to_csv(self.path)
 
         # Clear the records after saving
-        self.csv_records = []
+        self._identifiers = []
+        self._preds = []
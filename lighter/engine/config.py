@@ -1,10 +1,132 @@
 from typing import Any
 
+import contextlib
+import copy
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import cerberus
+import yaml
 from monai.bundle.config_parser import ConfigParser
+from monai.bundle.utils import merge_kv
 
 from lighter.engine.schema import SCHEMA
 
+try:
+    # The libyaml-backed loader is 5-10x faster than the pure-Python one.
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+
+@lru_cache(maxsize=64)
+def _load_config_file_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Load a config file. Keyed on (path, mtime, size) so unchanged files are parsed only once per process."""
+    if path.lower().endswith((".yaml", ".yml")):
+        if os.environ.get("LIGHTER_CACHE_YAML") == "1":
+            return _read_yaml_with_sidecar(path)
+        return _read_yaml(path)
+    return ConfigParser.load_config_file(path)
+
+
+def _read_yaml(path: str) -> dict:
+    """Parse a YAML file. The file is memory-mapped so the parser reads the page cache directly."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # An empty file cannot be memory-mapped.
+            return yaml.load(file, Loader=_YamlSafeLoader)  # nosec B506
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return yaml.load(buffer, Loader=_YamlSafeLoader)  # nosec B506
+        finally:
+            buffer.close()
+
+
+def _read_yaml_with_sidecar(path: str) -> dict:
+    """
+    Load a YAML file through a sibling `<path>.cache.json` file. JSON parses an order of magnitude
+    faster than YAML, so production runs that load the same config in many fresh processes (sweeps,
+    distributed launches) pay the YAML parse only when the file changes. Opt-in via the
+    `LIGHTER_CACHE_YAML=1` environment variable; the cache is best-effort and falls back to the
+    YAML parse whenever it is stale, missing, or unwritable.
+    """
+    cache_path = f"{path}.cache.json"
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            with open(cache_path, encoding="utf-8") as file:
+                return json.load(file)
+    except (OSError, ValueError):
+        # Missing or corrupt cache; fall through to the YAML parse.
+        pass
+
+    config = _read_yaml(path)
+
+    # Only cache documents that survive a JSON round-trip unchanged; e.g. non-string mapping
+    # keys would come back stringified, making cache-hit runs parse a different config.
+    try:
+        serialized = json.dumps(config)
+    except (TypeError, ValueError):
+        return config
+    if json.loads(serialized) != config:
+        return config
+
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # Write to a temp file and rename so concurrent processes never see a partial cache.
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(serialized)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # Read-only location; skip caching.
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+    return config
+
+
+def load_config_file(path: str) -> dict:
+    """
+    Load a single configuration file, serving repeated loads of an unchanged file from an in-memory cache.
+
+    Args:
+        path: Path to the configuration file.
+
+    Returns:
+        The loaded configuration dictionary. A deep copy is returned so that callers can safely mutate it
+        without affecting the cached entry.
+    """
+    stat = os.stat(path)
+    return copy.deepcopy(_load_config_file_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def _merge_config_files(paths: str) -> dict:
+    """
+    Load comma-separated config file path(s) into a single dictionary.
+    Multiple files are loaded concurrently, as file I/O and the libyaml parser release the GIL.
+    Keys are merged through `merge_kv` exactly as `ConfigParser.load_config_files` does: later
+    files override earlier top-level keys, and `+`-prefixed keys merge into the existing value.
+    """
+    path_list = [path.strip() for path in paths.split(",")]
+    if len(path_list) == 1:
+        configs = [load_config_file(path_list[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(path_list))) as executor:
+            # `map` preserves the file order, keeping the override semantics deterministic.
+            configs = list(executor.map(load_config_file, path_list))
+    parser = ConfigParser(config={})
+    for config in configs:
+        for key, value in config.items():
+            merge_kv(parser, key, value)
+    return parser.get()
+
+
+@lru_cache(maxsize=1)
+def _get_validator() -> cerberus.Validator:
+    """Build the schema validator once per process; cerberus compiles the schema on construction."""
+    return cerberus.Validator(SCHEMA)
+
 
 class ConfigurationException(Exception):
     """Custom exception for validation errors."""
@@ -35,6 +157,10 @@ class Config:
         if not isinstance(config, (dict, str, type(None))):
             raise ValueError("Invalid type for 'config'. Must be a dictionary or (comma-separated) path(s) to YAML file(s).")
 
+        # Load file path(s) through the cached loader so repeated runs don't re-parse unchanged files.
+        if isinstance(config, str):
+            config = _merge_config_files(config)
+
         self._config_parser = ConfigParser(globals=False)
         self._config_parser.read_config(config)
         self._config_parser.parse()
@@ -46,7 +172,7 @@ class Config:
 
         # Validate the configuration
         if validate:
-            validator = cerberus.Validator(SCHEMA)
+            validator = _get_validator()
             valid = validator.validate(self.get())
             if not valid:
                 errors = format_validation_errors(validator.errors)
@@ -24,10 +24,18 @@ class Resolver:
         if stage not in self.STAGE_MODES:
             raise ValueError(f"Invalid stage: {stage}. Allowed stages are {list(self.STAGE_MODES)}")
 
+        # Copy-on-write: shallow-copy only the dicts that are pruned, so the shared
+        # config tree stays intact without paying for a deep copy of the whole tree.
         stage_config = self.config.get().copy()
-        system_config = stage_config.get("system", {})
-        dataloader_config = system_config.get("dataloaders", {})
-        metrics_config = system_config.get("metrics", {})
+        system_config = stage_config.get("system", {}).copy()
+        dataloader_config = system_config.get("dataloaders", {}).copy()
+        metrics_config = system_config.get("metrics", {}).copy()
+        if "system" in stage_config:
+            stage_config["system"] = system_config
+        if "dataloaders" in system_config:
+            system_config["dataloaders"] = dataloader_config
+        if "metrics" in system_config:
+            system_config["metrics"] = metrics_config
 
         # Remove dataloaders not relevant to the current stage
         for mode in set(dataloader_config) - set(self.STAGE_MODES[stage]):
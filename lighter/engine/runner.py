@@ -81,34 +81,14 @@ class Runner:
 def cli():
     runner = Runner()
 
-    def fit(config: str, **config_overrides: Any):
-        runner.run(Stage.FIT, config, **config_overrides)
-
-    def validate(config: str, **config_overrides: Any):
-        runner.run(Stage.VALIDATE, config, **config_overrides)
-
-    def test(config: str, **config_overrides: Any):
-        runner.run(Stage.TEST, config, **config_overrides)
-
-    def predict(config: str, **config_overrides: Any):
-        runner.run(Stage.PREDICT, config, **config_overrides)
-
-    def lr_find(config: str, **config_overrides: Any):
-        runner.run(Stage.LR_FIND, config, **config_overrides)
-
-    def scale_batch_size(config: str, **config_overrides: Any):
-        runner.run(Stage.SCALE_BATCH_SIZE, config, **config_overrides)
-
-    fire.Fire(
-        {
-            "fit": fit,
-            "validate": validate,
-            "test": test,
-            "predict": predict,
-            "lr_find": lr_find,
-            "scale_batch_size": scale_batch_size,
-        }
-    )
+    def make_command(stage: Stage) -> Any:
+        def command(config: str, **config_overrides: Any):
+            runner.run(stage, config, **config_overrides)
+
+        return command
+
+    # Build the command table once from the Stage enum instead of hand-writing a wrapper per stage.
+    fire.Fire({stage.value: make_command(stage) for stage in Stage})
 
 
 if __name__ == "__main__":
@@ -39,6 +39,7 @@ SCHEMA = {
             "optimizer": {"type": "dict"},
             "scheduler": {"type": "dict"},
             "inferer": {"type": "dict"},
+            "channels_last": {"type": "boolean"},
             "metrics": {
                 "type": "dict",
                 "schema": {
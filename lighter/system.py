@@ -8,6 +8,7 @@ from typing import Any, Callable
 from dataclasses import asdict
 
 import pytorch_lightning as pl
+import torch
 from torch import Tensor
 from torch.nn import Module
 from torch.optim import Optimizer
@@ -23,6 +24,14 @@ from lighter.utils.types.enums import Data, Mode
 # Patch the original collate function to allow None values in the batch.
 default_collate_fn_map.update({type(None): collate_str_fn})
 
+# Module-level aliases for the modes checked on every step, skipping the enum class attribute lookup in hot methods.
+_TRAIN = Mode.TRAIN
+_PREDICT = Mode.PREDICT
+
+# Log-key suffixes formatted once at import instead of in every per-step f-string.
+_STEP_SUFFIX = f"/{Data.STEP}"
+_EPOCH_SUFFIX = f"/{Data.EPOCH}"
+
 
 class System(pl.LightningModule):
     """
@@ -38,9 +47,37 @@ class System(pl.LightningModule):
         adapters: Adapters for batch preparation, criterion argument adaptation, metrics argument adaptation, and logging data adaptation.
         inferer: Inferer to use in val/test/predict modes.
             See MONAI inferers for more details: (https://docs.monai.io/en/stable/inferers.html).
+        channels_last: Whether to convert the model and 4D inputs to channels-last memory format,
+            which enables tensor-core NHWC kernels for convolutional models on modern GPUs.
 
     """
 
+    # Mode sets used for per-step membership checks. Class-level frozensets avoid rebuilding a list on every step.
+    _INFERER_MODES = frozenset({Mode.VAL, Mode.TEST, Mode.PREDICT})
+    _LOSS_MODES = frozenset({Mode.TRAIN, Mode.VAL})
+
+    # Slots turn the step-path attribute reads into direct slot loads. Only attributes that are set in
+    # __init__ or flipped per phase are slotted; `model` and `criterion` are typically Modules, which
+    # `nn.Module.__setattr__` registers into `_modules` instead of writing the attribute, and everything
+    # else (including Lightning's internals) continues to live in the `__dict__` inherited from Module.
+    __slots__ = (
+        "dataloaders",
+        "optimizer",
+        "scheduler",
+        "metrics",
+        "adapters",
+        "inferer",
+        "channels_last",
+        "mode",
+        "_mode_adapters",
+        "_mode_metrics",
+        "_mode_batch_size",
+        "_mode_log_prefixes",
+        "_logger_available",
+        "_forward_accepts_epoch",
+        "_forward_accepts_step",
+    )
+
     def __init__(
         self,
         model: Module,
@@ -51,11 +88,15 @@ class System(pl.LightningModule):
         metrics: dict[str, Metric | list[Metric] | dict[str, Metric]] | None = None,
         adapters: dict[str, Callable] | None = None,
         inferer: Callable | None = None,
+        channels_last: bool = False,
     ) -> None:
         super().__init__()
 
         # Model setup
         self.model = model
+        self.channels_last = channels_last
+        if channels_last:
+            self.model = self.model.to(memory_format=torch.channels_last)
         self.dataloaders = DataLoaders(**(dataloaders or {}))
         self.optimizer = optimizer
         self.scheduler = scheduler
@@ -65,6 +106,15 @@ class System(pl.LightningModule):
         self.inferer = inferer
 
         self.mode = None
+        # Per-mode handles cached by `_on_mode_start` so the step functions skip string-keyed getattr calls.
+        self._mode_adapters = None
+        self._mode_metrics = None
+        self._mode_batch_size = None
+        self._mode_log_prefixes = None
+        self._logger_available = None
+        # Checked once here because `hasarg` relies on `inspect.signature`, which is too slow for the per-step forward.
+        self._forward_accepts_epoch = hasarg(self.model.forward, Data.EPOCH)
+        self._forward_accepts_step = hasarg(self.model.forward, Data.STEP)
         self._setup_mode_hooks()
         self._register_metrics()
 
@@ -100,8 +150,7 @@ class System(pl.LightningModule):
         Returns:
             tuple: A tuple containing (input, target, identifier).
         """
-        adapters = getattr(self.adapters, self.mode)
-        input, target, identifier = adapters.batch(batch)
+        input, target, identifier = self._mode_adapters.batch(batch)
         return input, target, identifier
 
     def forward(self, input: Any) -> Any:  # pylint: disable=arguments-differ
@@ -115,15 +164,19 @@ class System(pl.LightningModule):
             Any: The model's output.
         """
 
+        # Match the model's channels-last layout so convolutions don't pay an implicit relayout.
+        if self.channels_last and isinstance(input, Tensor) and input.dim() == 4:
+            input = input.to(memory_format=torch.channels_last)
+
         # Pass `epoch` and/or `step` argument to forward if it accepts them
         kwargs = {}
-        if hasarg(self.model.forward, Data.EPOCH):
+        if self._forward_accepts_epoch:
             kwargs[Data.EPOCH] = self.current_epoch
-        if hasarg(self.model.forward, Data.STEP):
+        if self._forward_accepts_step:
             kwargs[Data.STEP] = self.global_step
 
         # Predict. Use inferer if available in val, test, and predict modes.
-        if self.inferer and self.mode in [Mode.VAL, Mode.TEST, Mode.PREDICT]:
+        if self.inferer and self.mode in self._INFERER_MODES:
             return self.inferer(input, self.model, **kwargs)
         return self.model(input, **kwargs)
 
@@ -143,12 +196,11 @@ class System(pl.LightningModule):
             ValueError: If criterion is not specified in train/val mode or if loss dict is missing 'total' key.
         """
         loss = None
-        if self.mode in [Mode.TRAIN, Mode.VAL]:
+        if self.mode in self._LOSS_MODES:
             if self.criterion is None:
                 raise ValueError("Please specify 'system.criterion' in the config.")
 
-            adapters = getattr(self.adapters, self.mode)
-            loss = adapters.criterion(self.criterion, input, target, pred)
+            loss = self._mode_adapters.criterion(self.criterion, input, target, pred)
 
             if isinstance(loss, dict) and "total" not in loss:
                 raise ValueError(
@@ -169,12 +221,9 @@ class System(pl.LightningModule):
         Returns:
             The calculated metrics or None if in predict mode or no metrics specified.
         """
-        metrics = None
-        if self.mode != Mode.PREDICT:
-            metrics = getattr(self.metrics, self.mode)
-            if metrics is not None:
-                adapters = getattr(self.adapters, self.mode)
-                metrics = adapters.metrics(metrics, input, target, pred)
+        metrics = self._mode_metrics
+        if metrics is not None:
+            metrics = self._mode_adapters.metrics(metrics, input, target, pred)
         return metrics
 
     def _log_stats(self, loss: Tensor | dict[str, Tensor], metrics: MetricCollection, batch_idx: int) -> None:
@@ -186,41 +235,60 @@ class System(pl.LightningModule):
             metrics: The calculated metrics.
             batch_idx: The index of the batch.
         """
-        if self.trainer.logger is None:
+        # `_on_mode_start` caches the logger's availability for the phase; fall back to the
+        # trainer lookup when called outside a phase.
+        logger_available = self._logger_available
+        if logger_available is None:
+            logger_available = self.trainer.logger is not None
+        if not logger_available:
             return
 
+        on_step_stats = {}
+        on_epoch_stats = {}
+
+        # Normalize loss to a dict sentinel so the collection below iterates uniformly:
+        # no loss becomes an empty dict, a scalar loss a single unnamed entry.
+        if loss is None:
+            loss = {}
+        elif not isinstance(loss, dict):
+            loss = {None: loss}
+
+        loss_prefix, metrics_prefix = self._mode_log_prefixes or (f"{self.mode}/{Data.LOSS}", f"{self.mode}/{Data.METRICS}")
+
         # Loss
-        if loss is not None:
-            if not isinstance(loss, dict):
-                self._log(f"{self.mode}/{Data.LOSS}/{Data.STEP}", loss, on_step=True)
-                self._log(f"{self.mode}/{Data.LOSS}/{Data.EPOCH}", loss, on_epoch=True)
-            else:
-                for name, subloss in loss.items():
-                    self._log(f"{self.mode}/{Data.LOSS}/{name}/{Data.STEP}", subloss, on_step=True)
-                    self._log(f"{self.mode}/{Data.LOSS}/{name}/{Data.EPOCH}", subloss, on_epoch=True)
+        for name, subloss in loss.items():
+            prefix = loss_prefix if name is None else f"{loss_prefix}/{name}"
+            on_step_stats[prefix + _STEP_SUFFIX] = subloss
+            on_epoch_stats[prefix + _EPOCH_SUFFIX] = subloss
 
         # Metrics
-        if metrics is not None:
-            for name, metric in metrics.items():
-                self._log(f"{self.mode}/{Data.METRICS}/{name}/{Data.STEP}", metric, on_step=True)
-                self._log(f"{self.mode}/{Data.METRICS}/{name}/{Data.EPOCH}", metric, on_epoch=True)
+        for name, metric in (metrics or {}).items():
+            prefix = f"{metrics_prefix}/{name}"
+            on_step_stats[prefix + _STEP_SUFFIX] = metric
+            on_epoch_stats[prefix + _EPOCH_SUFFIX] = metric
 
         # Optimizer's lr, momentum, beta. Logged in train mode and once per epoch.
-        if self.mode == Mode.TRAIN and batch_idx == 0:
+        if self.mode == _TRAIN and batch_idx == 0:
             for name, optimizer_stat in get_optimizer_stats(self.optimizer).items():
-                self._log(f"{self.mode}/{name}", optimizer_stat, on_epoch=True)
+                on_epoch_stats[f"{self.mode}/{name}"] = optimizer_stat
 
-    def _log(self, name: str, value: Any, on_step: bool = False, on_epoch: bool = False) -> None:
-        """Log a key, value pair. Syncs across distributed nodes if `on_epoch` is True.
+        # A single `log_dict` call per group replaces Lightning's per-key dispatch and, for the
+        # epoch group under DDP, merges the per-key sync collectives into one.
+        self._log_dict(on_step_stats, on_epoch=False)
+        self._log_dict(on_epoch_stats, on_epoch=True)
+
+    def _log_dict(self, stats: dict[str, Any], on_epoch: bool) -> None:
+        """Log a dict of key, value pairs. Syncs across distributed nodes if `on_epoch` is True.
 
         Args:
-            name (str): key to log.
-            value (Any): value to log.
-            on_step (bool, optional): if True, logs on step.
-            on_epoch (bool, optional): if True, logs on epoch with sync_dist=True.
+            stats (dict): key, value pairs to log.
+            on_epoch (bool): if True, logs on epoch with sync_dist=True, otherwise on step.
         """
-        batch_size = getattr(self.dataloaders, self.mode).batch_size
-        self.log(name, value, logger=True, batch_size=batch_size, on_step=on_step, on_epoch=on_epoch, sync_dist=on_epoch)
+        if not stats:
+            return
+        self.log_dict(
+            stats, logger=True, batch_size=self._mode_batch_size, on_step=not on_epoch, on_epoch=on_epoch, sync_dist=on_epoch
+        )
 
     def _prepare_output(
         self,
@@ -245,8 +313,7 @@ class System(pl.LightningModule):
         Returns:
             dict: A dictionary containing all the step information.
         """
-        adapters = getattr(self.adapters, self.mode)
-        input, target, pred = adapters.logging(input, target, pred)
+        input, target, pred = self._mode_adapters.logging(input, target, pred)
         return {
             Data.IDENTIFIER: identifier,
             Data.INPUT: input,
@@ -288,27 +355,47 @@ class System(pl.LightningModule):
         """
         Sets up the training, validation, testing, and prediction hooks based on defined dataloaders.
         """
+        # The dataloader hooks bind their dataloader through a default argument, resolving the
+        # attribute chain once at definition instead of on every hook call.
         if self.dataloaders.train is not None:
             self.training_step = self._step
-            self.train_dataloader = lambda: self.dataloaders.train
+            self.train_dataloader = lambda dataloader=self.dataloaders.train: dataloader
             self.on_train_start = lambda: self._on_mode_start(Mode.TRAIN)
             self.on_train_end = self._on_mode_end
         if self.dataloaders.val is not None:
             self.validation_step = self._step
-            self.val_dataloader = lambda: self.dataloaders.val
+            self.val_dataloader = lambda dataloader=self.dataloaders.val: dataloader
             self.on_validation_start = lambda: self._on_mode_start(Mode.VAL)
             self.on_validation_end = self._on_mode_end
         if self.dataloaders.test is not None:
             self.test_step = self._step
-            self.test_dataloader = lambda: self.dataloaders.test
+            self.test_dataloader = lambda dataloader=self.dataloaders.test: dataloader
             self.on_test_start = lambda: self._on_mode_start(Mode.TEST)
             self.on_test_end = self._on_mode_end
         if self.dataloaders.predict is not None:
             self.predict_step = self._step
-            self.predict_dataloader = lambda: self.dataloaders.predict
+            self.predict_dataloader = lambda dataloader=self.dataloaders.predict: dataloader
             self.on_predict_start = lambda: self._on_mode_start(Mode.PREDICT)
             self.on_predict_end = self._on_mode_end
 
+    def __getstate__(self) -> dict:
+        """`nn.Module`'s pickling only covers `__dict__`; fold the slot attributes into the state."""
+        state = super().__getstate__()
+        for name in self.__slots__:
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the slot attributes before handing the remaining state to `nn.Module`."""
+        state = dict(state)
+        for name in self.__slots__:
+            if name in state:
+                object.__setattr__(self, name, state.pop(name))
+        super().__setstate__(state)
+
     def _on_mode_start(self, mode: str | None) -> None:
         """
         Sets the current mode at the start of a phase.
@@ -317,12 +404,29 @@ class System(pl.LightningModule):
             mode: The mode to set (train, val, test, or predict).
         """
         self.mode = mode
+        # Resolve the per-mode components once per phase instead of once per step. The metrics are set via
+        # `object.__setattr__` because `nn.Module.__setattr__` would divert a `MetricCollection` (a `Module`)
+        # into `_modules` and leave the slot at its initial None, silently disabling metrics; the collection
+        # is already registered for device placement in `_register_metrics`.
+        self._mode_adapters = getattr(self.adapters, mode)
+        object.__setattr__(self, "_mode_metrics", getattr(self.metrics, mode) if mode != _PREDICT else None)
+        self._mode_batch_size = getattr(self.dataloaders, mode).batch_size
+        # Loss/metrics log-key prefixes, formatted once per phase instead of once per step.
+        self._mode_log_prefixes = (f"{mode}/{Data.LOSS}", f"{mode}/{Data.METRICS}")
+        # A logger cannot be (de)attached mid-phase, so check once here rather than in every `_log_stats` call.
+        trainer = self._trainer
+        self._logger_available = trainer is not None and trainer.logger is not None
 
     def _on_mode_end(self) -> None:
         """
         Resets the mode at the end of a phase.
         """
         self.mode = None
+        self._mode_adapters = None
+        self._mode_metrics = None
+        self._mode_batch_size = None
+        self._mode_log_prefixes = None
+        self._logger_available = None
 
     @property
     def learning_rate(self) -> float:
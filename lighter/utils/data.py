@@ -3,8 +3,99 @@ from typing import Any, Callable
 import random
 
 import torch
+from torch import Tensor
+from torch.utils.data import DataLoader
 from torch.utils.data.dataloader import default_collate
 
+# Sentinel marking the end of a prefetched iteration.
+_PREFETCH_DONE = object()
+
+
+class CUDAPrefetcher:
+    """
+    Wraps a DataLoader and copies the next batch to a CUDA device on a side stream while the
+    current batch is being processed, overlapping the host-to-device transfer with compute.
+    Use `pin_memory=True` on the wrapped DataLoader so the copies are asynchronous.
+
+    Example:
+        ```
+        dataloaders:
+            train:
+                _target_: lighter.utils.data.CUDAPrefetcher
+                loader:
+                    _target_: torch.utils.data.DataLoader
+                    pin_memory: True
+                    ...
+        ```
+
+    Args:
+        loader: The DataLoader to wrap.
+        device: The CUDA device to copy batches to. Defaults to the current CUDA device.
+
+    Raises:
+        ValueError: If no CUDA device is available.
+    """
+
+    def __init__(self, loader: DataLoader, device: str | torch.device | None = None) -> None:
+        if not torch.cuda.is_available():
+            raise ValueError("CUDAPrefetcher requires an available CUDA device.")
+        self.loader = loader
+        self.device = torch.device(device) if device is not None else torch.device("cuda", torch.cuda.current_device())
+        self.stream = torch.cuda.Stream(self.device)
+
+    def __iter__(self) -> Any:
+        iterator = iter(self.loader)
+        next_batch = self._preload(iterator)
+        while next_batch is not _PREFETCH_DONE:
+            # Make the compute stream wait for the copy of the batch it is about to consume.
+            torch.cuda.current_stream(self.device).wait_stream(self.stream)
+            batch = next_batch
+            # Tie the batch tensors to the compute stream so the caching allocator does not
+            # reuse their memory while the copy stream is already filling the next batch.
+            self._record_stream(batch)
+            next_batch = self._preload(iterator)
+            yield batch
+
+    def __len__(self) -> int:
+        return len(self.loader)
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate attributes such as `batch_size` or `dataset` to the wrapped loader.
+        return getattr(self.loader, name)
+
+    def _preload(self, iterator: Any) -> Any:
+        """Fetch the next batch and start its device copy on the side stream."""
+        try:
+            batch = next(iterator)
+        except StopIteration:
+            return _PREFETCH_DONE
+        with torch.cuda.stream(self.stream):
+            return self._move(batch)
+
+    def _move(self, data: Any) -> Any:
+        """Recursively move tensors in a batch structure to the device with non-blocking copies."""
+        if isinstance(data, Tensor):
+            return data.to(self.device, non_blocking=True)
+        if isinstance(data, dict):
+            return {key: self._move(value) for key, value in data.items()}
+        if isinstance(data, tuple) and hasattr(data, "_fields"):
+            # Namedtuples, which `default_collate` preserves, are rebuilt from positional args.
+            return type(data)(*(self._move(item) for item in data))
+        if isinstance(data, (list, tuple)):
+            return type(data)(self._move(item) for item in data)
+        return data
+
+    def _record_stream(self, data: Any) -> None:
+        """Recursively record the compute stream on the tensors of a consumed batch."""
+        if isinstance(data, Tensor):
+            data.record_stream(torch.cuda.current_stream(self.device))
+        elif isinstance(data, dict):
+            for value in data.values():
+                self._record_stream(value)
+        elif isinstance(data, (list, tuple)):
+            for item in data:
+                self._record_stream(item)
+
 
 def collate_replace_corrupted(
     batch: Any, dataset: torch.utils.data.Dataset, default_collate_fn: Callable | None = None
@@ -36,3 +127,24 @@ def collate_replace_corrupted(
         return collate_replace_corrupted(batch, dataset)
     # Finally, when the whole batch is fine, apply the default collate function.
     return default_collate_fn(batch)
+
+
+class CollateReplaceCorrupted:
+    """
+    Callable-class form of `collate_replace_corrupted` for use as a DataLoader `collate_fn`.
+    Unlike binding the dataset with `functools.partial` or a lambda, a plain class instance
+    pickles cleanly into spawned DataLoader worker processes.
+
+    Args:
+        dataset: The dataset being used, which should return `None` for corrupted examples.
+        default_collate_fn: The default collate function to use once the batch is clean.
+    """
+
+    __slots__ = ("dataset", "default_collate_fn")
+
+    def __init__(self, dataset: torch.utils.data.Dataset, default_collate_fn: Callable | None = None) -> None:
+        self.dataset = dataset
+        self.default_collate_fn = default_collate_fn
+
+    def __call__(self, batch: Any) -> Any:
+        return collate_replace_corrupted(batch, self.dataset, self.default_collate_fn)
@@ -103,14 +103,18 @@ def get_optimizer_stats(optimizer: Optimizer) -> dict[str, float]:
             Where [/group{N}] is only added for optimizers with multiple groups.
     """
     stats_dict = {}
-    for group_idx, group in enumerate(optimizer.param_groups):
-        lr_key = f"optimizer/{optimizer.__class__.__name__}/lr"
-        momentum_key = f"optimizer/{optimizer.__class__.__name__}/momentum"
+    # Base keys and the group check are computed once; only the group suffix varies per iteration.
+    base_lr_key = f"optimizer/{optimizer.__class__.__name__}/lr"
+    base_momentum_key = f"optimizer/{optimizer.__class__.__name__}/momentum"
+    multiple_groups = len(optimizer.param_groups) > 1
 
+    for group_idx, group in enumerate(optimizer.param_groups):
         # Add group index to the key if there are multiple parameter groups
-        if len(optimizer.param_groups) > 1:
-            lr_key += f"/group{group_idx+1}"
-            momentum_key += f"/group{group_idx+1}"
+        if multiple_groups:
+            lr_key = f"{base_lr_key}/group{group_idx+1}"
+            momentum_key = f"{base_momentum_key}/group{group_idx+1}"
+        else:
+            lr_key, momentum_key = base_lr_key, base_momentum_key
 
         # Extracting learning rate
         stats_dict[lr_key] = group["lr"]
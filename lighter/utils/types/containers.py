@@ -30,7 +30,7 @@ def nested(cls):
     return cls
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     train: Metric | MetricCollection | None = None
     val: Metric | MetricCollection | None = None
@@ -42,13 +42,13 @@ class Metrics:
         self.test = self._convert_to_collection(self.test)
 
     def _convert_to_collection(self, x):
-        if x is None:
+        # Idempotent: None and already-wrapped collections are returned as-is.
+        if x is None or isinstance(x, MetricCollection):
             return x
-        if not isinstance(x, MetricCollection):
-            return MetricCollection(x)
+        return MetricCollection(x)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataLoaders:
     train: Any | None = None
     val: Any | None = None
@@ -56,7 +56,7 @@ class DataLoaders:
     predict: Any | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Train:
     """Train mode sub-dataclass for Adapters."""
 
@@ -66,7 +66,7 @@ class Train:
     logging: LoggingAdapter = field(default_factory=LoggingAdapter)
 
 
-@dataclass
+@dataclass(slots=True)
 class Val:
     """Val mode sub-dataclass for Adapters."""
 
@@ -76,7 +76,7 @@ class Val:
     logging: LoggingAdapter = field(default_factory=LoggingAdapter)
 
 
-@dataclass
+@dataclass(slots=True)
 class Test:
     """Test mode sub-dataclass for Adapters."""
 
@@ -85,7 +85,7 @@ class Test:
     logging: LoggingAdapter = field(default_factory=LoggingAdapter)
 
 
-@dataclass
+@dataclass(slots=True)
 class Predict:
     """Predict mode sub-dataclass for Adapters."""
 
@@ -94,7 +94,7 @@ class Predict:
 
 
 @nested
-@dataclass
+@dataclass(slots=True)
 class Adapters:
     """Root configuration class for all adapters across different modes."""
 
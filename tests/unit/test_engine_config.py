@@ -1,8 +1,16 @@
 """Unit tests for the Config class in lighter/engine/config.py"""
 
+import os
+
 import pytest
+import yaml
+
+from lighter.engine.config import Config, ConfigurationException, _read_yaml_with_sidecar, load_config_file
+
 
-from lighter.engine.config import Config, ConfigurationException
+def write_yaml(path, content):
+    """Write a dictionary to a YAML file."""
+    path.write_text(yaml.safe_dump(content))
 
 
 def test_config_initialization_with_dict():
@@ -25,6 +33,128 @@ def test_config_initialization_with_invalid_type():
         Config(123, validate=False)
 
 
+def test_config_initialization_with_file(tmp_path):
+    """Test initializing Config with a path to a YAML file."""
+    config_dict = {
+        "trainer": {"max_epochs": 10},
+        "system": {"model": "test_model"},
+    }
+    config_file = tmp_path / "config.yaml"
+    write_yaml(config_file, config_dict)
+
+    config = Config(str(config_file), validate=False)
+    result = config.get()
+    result.pop("_meta_", None)  # Remove _meta_ field for comparison
+    assert result == config_dict
+
+
+def test_load_config_file_cache_isolation(tmp_path):
+    """Test that mutating a loaded config does not leak into subsequent loads of the same file."""
+    config_file = tmp_path / "config.yaml"
+    write_yaml(config_file, {"trainer": {"max_epochs": 10}})
+
+    first = load_config_file(str(config_file))
+    first["trainer"]["max_epochs"] = 999
+    second = load_config_file(str(config_file))
+    assert second["trainer"]["max_epochs"] == 10
+
+
+def test_load_config_file_mtime_invalidation(tmp_path):
+    """Test that modifying a file invalidates its cached entry."""
+    config_file = tmp_path / "config.yaml"
+    write_yaml(config_file, {"trainer": {"max_epochs": 10}})
+    assert load_config_file(str(config_file))["trainer"]["max_epochs"] == 10
+
+    write_yaml(config_file, {"trainer": {"max_epochs": 20}})
+    # Bump the modification time explicitly in case the filesystem's resolution is too coarse.
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config_file(str(config_file))["trainer"]["max_epochs"] == 20
+
+
+def test_yaml_sidecar_cache_creation_and_hit(tmp_path):
+    """Test that the sidecar cache is written on a miss and served on a hit."""
+    config_file = tmp_path / "config.yaml"
+    cache_file = tmp_path / "config.yaml.cache.json"
+    write_yaml(config_file, {"trainer": {"max_epochs": 10}})
+
+    assert _read_yaml_with_sidecar(str(config_file)) == {"trainer": {"max_epochs": 10}}
+    assert cache_file.exists()
+
+    # Rewrite the cache with different content; a fresh load must serve it, proving the hit path.
+    cache_file.write_text('{"trainer": {"max_epochs": 20}}')
+    stat = os.stat(config_file)
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _read_yaml_with_sidecar(str(config_file)) == {"trainer": {"max_epochs": 20}}
+
+
+def test_yaml_sidecar_stale_and_corrupt_cache(tmp_path):
+    """Test that stale or corrupt sidecar caches fall back to the YAML parse."""
+    config_file = tmp_path / "config.yaml"
+    cache_file = tmp_path / "config.yaml.cache.json"
+    write_yaml(config_file, {"trainer": {"max_epochs": 10}})
+    stat = os.stat(config_file)
+
+    # Stale: cache older than the YAML file.
+    cache_file.write_text('{"trainer": {"max_epochs": 20}}')
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000))
+    assert _read_yaml_with_sidecar(str(config_file))["trainer"]["max_epochs"] == 10
+
+    # Corrupt: newer than the YAML file but not valid JSON.
+    cache_file.write_text("{not json")
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _read_yaml_with_sidecar(str(config_file))["trainer"]["max_epochs"] == 10
+
+
+def test_yaml_sidecar_skips_non_roundtrippable_configs(tmp_path):
+    """Test that configs JSON would alter (e.g. int mapping keys get stringified) are not cached."""
+    config_file = tmp_path / "config.yaml"
+    write_yaml(config_file, {"labels": {0: "background", 1: "lesion"}})
+
+    assert _read_yaml_with_sidecar(str(config_file)) == {"labels": {0: "background", 1: "lesion"}}
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+
+def test_yaml_sidecar_env_gate(tmp_path, monkeypatch):
+    """Test that load_config_file writes the sidecar cache only when LIGHTER_CACHE_YAML=1."""
+    plain_file = tmp_path / "plain.yaml"
+    write_yaml(plain_file, {"trainer": {"max_epochs": 10}})
+    monkeypatch.delenv("LIGHTER_CACHE_YAML", raising=False)
+    load_config_file(str(plain_file))
+    assert not (tmp_path / "plain.yaml.cache.json").exists()
+
+    gated_file = tmp_path / "gated.yaml"
+    write_yaml(gated_file, {"trainer": {"max_epochs": 10}})
+    monkeypatch.setenv("LIGHTER_CACHE_YAML", "1")
+    load_config_file(str(gated_file))
+    assert (tmp_path / "gated.yaml.cache.json").exists()
+
+
+def test_config_merges_comma_separated_files(tmp_path):
+    """Test that later files override the top-level keys of earlier ones."""
+    base_file = tmp_path / "base.yaml"
+    override_file = tmp_path / "override.yaml"
+    write_yaml(base_file, {"trainer": {"max_epochs": 10}, "project": "base"})
+    write_yaml(override_file, {"trainer": {"max_epochs": 20}})
+
+    config = Config(f"{base_file},{override_file}", validate=False)
+    # The overriding file replaces the whole top-level key, while untouched keys are kept.
+    assert config.get("trainer")["max_epochs"] == 20
+    assert config.get("project") == "base"
+
+
+def test_config_merges_plus_prefixed_keys(tmp_path):
+    """Test that '+'-prefixed keys in later files merge into the existing value instead of replacing it."""
+    base_file = tmp_path / "base.yaml"
+    override_file = tmp_path / "override.yaml"
+    write_yaml(base_file, {"trainer": {"max_epochs": 10, "accelerator": "cpu"}})
+    write_yaml(override_file, {"+trainer": {"max_epochs": 20}})
+
+    config = Config(f"{base_file},{override_file}", validate=False)
+    assert config.get("trainer") == {"max_epochs": 20, "accelerator": "cpu"}
+    assert "+trainer" not in config.get()
+
+
 def test_config_validation():
     """Test that config validation works correctly."""
     # Valid config
@@ -43,6 +173,7 @@ def test_config_validation():
             "criterion": {
                 "_target_": "torch.nn.CrossEntropyLoss",
             },
+            "channels_last": True,
         },
         "trainer": {
             "_target_": "pytorch_lightning.Trainer",
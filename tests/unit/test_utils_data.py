@@ -1,4 +1,12 @@
-from lighter.utils.data import collate_replace_corrupted
+import pickle
+from collections import namedtuple
+from unittest import mock
+
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from lighter.utils.data import CollateReplaceCorrupted, CUDAPrefetcher, collate_replace_corrupted
 
 
 def test_collate_replace_corrupted_basic():
@@ -40,3 +48,85 @@ def test_collate_replace_corrupted_all_corrupted():
     collated_all_corrupted = collate_replace_corrupted(all_corrupted_batch, dataset)
     assert len(collated_all_corrupted) == len(all_corrupted_batch)
     assert all(val in dataset for val in collated_all_corrupted)
+
+
+def test_collate_replace_corrupted_class_pickles():
+    """Test that CollateReplaceCorrupted survives a pickle round-trip, its reason to exist
+    over binding the dataset with functools.partial or a lambda.
+
+    Tests:
+        - pickle round-trip preserves the bound dataset and default collate function
+        - the unpickled instance collates equivalently to the function it wraps
+    """
+    dataset = [1, 2, 3, 4, 5]
+    collate_fn = CollateReplaceCorrupted(dataset)
+    restored = pickle.loads(pickle.dumps(collate_fn))
+    assert restored.dataset == dataset
+    assert restored.default_collate_fn is None
+
+    batch = [1, None, 2]
+    collated = restored(batch)
+    assert len(collated) == len(batch)
+    assert collated[0].item() == 1
+    assert collated[1].item() == 2
+    assert collated[2].item() in dataset
+
+
+def _cpu_prefetcher(loader=None):
+    """Build a CUDAPrefetcher on CPU for testing, bypassing the CUDA check in __init__."""
+    prefetcher = CUDAPrefetcher.__new__(CUDAPrefetcher)
+    prefetcher.loader = loader
+    prefetcher.device = torch.device("cpu")
+    return prefetcher
+
+
+def test_cuda_prefetcher_requires_cuda(monkeypatch):
+    """Test that CUDAPrefetcher raises ValueError when no CUDA device is available."""
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: False)
+    with pytest.raises(ValueError, match="requires an available CUDA device"):
+        CUDAPrefetcher(DataLoader([1, 2, 3]))
+
+
+def test_cuda_prefetcher_delegates_to_loader():
+    """Test that __len__ and attribute access are delegated to the wrapped loader."""
+    loader = DataLoader([1, 2, 3, 4], batch_size=2)
+    prefetcher = _cpu_prefetcher(loader)
+    assert len(prefetcher) == len(loader)
+    assert prefetcher.batch_size == 2
+    assert prefetcher.dataset is loader.dataset
+
+
+def test_cuda_prefetcher_move_preserves_structure():
+    """Test that _move recurses over nested batch structures without altering them.
+
+    Tests:
+        - Tensors in dicts, lists, and plain tuples are moved while the containers keep their types
+        - Namedtuples (preserved by default_collate) are rebuilt as the same namedtuple type
+        - Non-tensor values pass through unchanged
+    """
+    Point = namedtuple("Point", ["x", "y"])
+    batch = {
+        "input": torch.randn(2, 3),
+        "meta": [torch.randn(2), "identifier"],
+        "pair": (torch.randn(1), 5),
+        "point": Point(x=torch.randn(2), y=torch.randn(2)),
+    }
+    moved = _cpu_prefetcher()._move(batch)
+
+    assert torch.equal(moved["input"], batch["input"])
+    assert isinstance(moved["meta"], list) and torch.equal(moved["meta"][0], batch["meta"][0])
+    assert moved["meta"][1] == "identifier"
+    assert isinstance(moved["pair"], tuple) and moved["pair"][1] == 5
+    assert isinstance(moved["point"], Point)
+    assert torch.equal(moved["point"].x, batch["point"].x)
+
+
+def test_cuda_prefetcher_record_stream_recurses(monkeypatch):
+    """Test that _record_stream reaches every tensor in a nested batch structure."""
+    monkeypatch.setattr(torch.cuda, "current_stream", lambda device=None: "stream")
+    tensors = [mock.MagicMock(spec=torch.Tensor) for _ in range(3)]
+    batch = {"input": tensors[0], "meta": [tensors[1], (tensors[2], "identifier")]}
+
+    _cpu_prefetcher()._record_stream(batch)
+    for tensor in tensors:
+        tensor.record_stream.assert_called_once_with("stream")